@@ -43,6 +43,9 @@ const __dirname = dirname(__filename);
 const distPath = join(__dirname, '..', 'dist');
 const configPath = join(__dirname, 'bridge-config.json');
 
+// Constant reply to client 'ping' messages, encoded once
+const PONG_FRAME = JSON.stringify({ type: 'pong' });
+
 class MeshtasticBridgeServer {
   constructor(port = 8080, host = '0.0.0.0') {
     this.wsPort = port;
@@ -1461,7 +1464,7 @@ class MeshtasticBridgeServer {
           break;
 
         case 'ping':
-          ws.send(JSON.stringify({ type: 'pong' }));
+          ws.send(PONG_FRAME);
           break;
 
         // AI Management
@@ -2219,6 +2222,27 @@ class MeshtasticBridgeServer {
         console.log(`🧹 Memory cleanup: Removed ${cleanedCount} old message IDs from deduplication cache`);
       }
 
+      // Clean up expired per-node rate limit entries (otherwise only pruned once a map exceeds 100 nodes)
+      let expiredRateLimits = 0;
+      for (const usageMap of [this.commandUsage, this.aiUsage]) {
+        for (const [nodeId, timestamps] of usageMap.entries()) {
+          if (!timestamps.some(t => now - t < 60000)) {
+            usageMap.delete(nodeId);
+            expiredRateLimits++;
+          }
+        }
+      }
+      for (const [nodeId, lastForward] of this.forwardNodeInfoRateLimit.entries()) {
+        if (now - lastForward >= 300000) {
+          this.forwardNodeInfoRateLimit.delete(nodeId);
+          expiredRateLimits++;
+        }
+      }
+
+      if (expiredRateLimits > 0) {
+        console.log(`🧹 Memory cleanup: Removed ${expiredRateLimits} expired rate limit entries`);
+      }
+
       // Report current memory usage
       const memUsage = {
         consoleBuffer: this.consoleBuffer.length,
@@ -2314,6 +2338,19 @@ class MeshtasticBridgeServer {
     return psk === this.publicChannelPSK;
   }
 
+  /**
+   * Check if a node number belongs to one of our own connected radios
+   * Walks the radios map directly so the per-packet check doesn't allocate
+   */
+  isBridgeRadioNode(nodeNum) {
+    for (const radio of this.radios.values()) {
+      if (radio.nodeNum === nodeNum) {
+        return true;
+      }
+    }
+    return false;
+  }
+
   handleMessagePacket(radioId, portPath, packet, protocol) {
     try {
       console.log(`📨 Message packet from ${radioId} (${protocol}):`, {
@@ -2376,9 +2413,7 @@ class MeshtasticBridgeServer {
         }
 
         // Check if this message is FROM one of our bridge radios (forwarding loop prevention)
-        const isFromOurBridgeRadio = Array.from(this.radios.values()).some(
-          radio => radio.nodeNum === packet.from
-        );
+        const isFromOurBridgeRadio = this.isBridgeRadioNode(packet.from);
 
         if (isFromOurBridgeRadio) {
           console.log(`🔁 Message from our own bridge radio ${packet.from}, skipping forward to prevent loop`);
@@ -2486,9 +2521,7 @@ class MeshtasticBridgeServer {
       });
 
       // Check if this is from one of our bridge radios (prevent forwarding our own announcements)
-      const isFromOurBridgeRadio = Array.from(this.radios.values()).some(
-        radio => radio.nodeNum === packet.from
-      );
+      const isFromOurBridgeRadio = this.isBridgeRadioNode(packet.from);
 
       if (isFromOurBridgeRadio) {
         console.log(`🔁 Node info from our own bridge radio ${packet.from}, skipping forward`);
@@ -2505,10 +2538,11 @@ class MeshtasticBridgeServer {
         return;
       }
 
-      // Mark as forwarded
+      // Mark as forwarded (re-insert so Map order tracks recency for LRU eviction)
+      this.forwardNodeInfoRateLimit.delete(nodeId);
       this.forwardNodeInfoRateLimit.set(nodeId, now);
 
-      // Clean up old entries (keep only last 100 nodes)
+      // Clean up least recently forwarded entries (keep only last 100 nodes)
       if (this.forwardNodeInfoRateLimit.size > 100) {
         const firstKey = this.forwardNodeInfoRateLimit.keys().next().value;
         this.forwardNodeInfoRateLimit.delete(firstKey);